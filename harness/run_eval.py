@@ -1,5 +1,6 @@
 from __future__ import annotations
 import argparse
+import gc
 import json
 import os
 import sys
@@ -33,6 +34,8 @@ else:
     from .utils.template import render_template
     from .utils import profiling
 
+# libyaml-backed loader when PyYAML was built with it; same safe semantics, much faster parsing
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 import importlib
 ADAPTERS: Dict[str, Any] = {}
@@ -301,7 +304,7 @@ def load_questions(item_dir: Path) -> List[Question]:
 
     raw_questions: List[Dict[str, Any]] = []
     try:
-        data = yaml.safe_load(q_path.read_text(encoding='utf-8'))
+        data = yaml.load(q_path.read_bytes(), Loader=_YAML_LOADER)
     except Exception as exc:
         raise SystemExit(f"Failed to load {q_path}: {exc}")
     if isinstance(data, dict):
@@ -433,15 +436,14 @@ def load_inventory(item_dir: Path) -> Inventory:
                 tpl_dir = (item_dir / tpath).resolve()
                 inv_file = tpl_dir / "inventory.json"
                 if inv_file.exists():
-                    inv = json.loads(inv_file.read_text(encoding='utf-8'))
-                    return Inventory.model_validate(inv)
+                    # Parse and validate in one pass (pydantic-core JSON parser)
+                    return Inventory.model_validate_json(inv_file.read_bytes())
         except Exception:
             pass
     # Fallback to local inventory.json
     local = item_dir / "inventory.json"
     if local.exists():
-        inv = json.loads(local.read_text(encoding='utf-8'))
-        return Inventory.model_validate(inv)
+        return Inventory.model_validate_json(local.read_bytes())
     raise FileNotFoundError(f"inventory.json not found for item {item_dir}")
 
 
@@ -855,6 +857,11 @@ def main():
     if args.max_items and args.max_items > 0:
         items = items[: args.max_items]
 
+    # Loaded items and adapters live for the whole run; move them
+    # out of the collector's view so per-question garbage collections stay cheap.
+    gc.collect()
+    gc.freeze()
+
     # Pre-compute totals for progress bars
     total_questions = sum(len(it.questions) for it in items)
     total = 0
@@ -1231,11 +1238,20 @@ def main():
                     ext_map = {"spice_netlist": "sp", "casIR": "cir", "cascode": "cas"}
                     template_file = tdir / f"netlist.{ext_map.get(modality, 'sp')}"
                     if template_file.exists():
-                        # Try UTF-8 first, then UTF-16 if that fails
-                        try:
-                            return template_file.read_text(encoding='utf-8')
-                        except UnicodeDecodeError:
-                            return template_file.read_text(encoding='utf-16')
+                        # Read once; a UTF-16 BOM picks the codec up front, otherwise
+                        # UTF-8 with UTF-16 as the fallback
+                        raw = template_file.read_bytes()
+                        if raw[:2] in (b"\xff\xfe", b"\xfe\xff"):
+                            text = raw.decode('utf-16')
+                        else:
+                            try:
+                                text = raw.decode('utf-8')
+                            except UnicodeDecodeError:
+                                text = raw.decode('utf-16')
+                        # Match read_text()'s universal-newline translation
+                        if "\r" in text:
+                            text = text.replace("\r\n", "\n").replace("\r", "\n")
+                        return text
                 except Exception:
                     pass
                 return fallback
@@ -1318,17 +1334,17 @@ def main():
 
             # Predict
             error_msg: str | None = None
-            pred_timer = perf_counter() if profiling.is_enabled() else None
             try:
-                pred = adapter.predict([
-                    {
-                        "prompt": prompt,
-                        "artifact_path": str(item_dir / q.artifact_path),
-                        "artifact": artifact_used,
-                        "inventory_ids": inv_ids,
-                        "question": q.model_dump(),
-                    }
-                ])[0]
+                with profiling.section("adapter", "predict", context=f"model={slug}"):
+                    pred = adapter.predict([
+                        {
+                            "prompt": prompt,
+                            "artifact_path": str(item_dir / q.artifact_path),
+                            "artifact": artifact_used,
+                            "inventory_ids": inv_ids,
+                            "question": q.model_dump(),
+                        }
+                    ])[0]
             except Exception as e:
                 pred = ""
                 error_msg = str(getattr(e, "message", e)) or str(e)
@@ -1336,10 +1352,6 @@ def main():
                 print(f"[ERROR] Prediction failed for {Path(it.item_dir).name}/{q.id}: {error_msg}", file=sys.stderr, flush=True)
                 print(f"[ERROR] Full traceback:", file=sys.stderr, flush=True)
                 traceback.print_exc(file=sys.stderr)
-            finally:
-                if profiling.is_enabled() and pred_timer is not None:
-                    elapsed_ms = (perf_counter() - pred_timer) * 1000
-                    profiling.log("adapter", "predict", elapsed_ms, context=f"model={slug}")
 
             # Judge prompt (Markdown) and variables
             if not q.judge_prompt:
@@ -1,15 +1,51 @@
 """Unit tests for randomize_spice function to verify subcircuit preservation."""
 
+import re
 import unittest
 from harness.run_eval import randomize_spice
 
 
-class TestRandomizeSpice(unittest.TestCase):
-    """Test that randomize_spice preserves subcircuit definitions."""
+# Line kinds reported by _classify_lines (order matches the _LINE_RE groups)
+SUBCKT, ENDS, FOOTER, MODEL, PARAM, DIRECTIVE, COMMENT, CONTINUATION, DEVICE = range(9)
+# Kinds that make up device statements (a device line plus its '+' continuations)
+_STATEMENT_KINDS = frozenset((DEVICE, CONTINUATION))
 
-    def test_subcircuit_not_shuffled(self):
-        """Test that .subckt/.ends blocks are preserved in order and not shuffled."""
-        netlist = """.subckt opamp in_n in_p out
+# Netlists are ASCII, so classify over bytes and skip unicode-aware matching
+_LINE_RE = re.compile(
+    rb"^[ \t]*(?:(\.subckt)|(\.ends)|(\.end|\.backanno)|(\.model)|(\.param)|(\.)|([*;])|(\+)|(\S))",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def _iter_line_kinds(text):
+    """Yield (line_index, kind) for every non-blank netlist line; indices match text.splitlines()."""
+    data = text.encode("utf-8")
+    line = 0
+    pos = 0
+    for m in _LINE_RE.finditer(data):
+        line += data.count(b"\n", pos, m.start())
+        pos = m.start()
+        yield line, m.lastindex - 1
+
+
+def _classify_lines(text):
+    """Classify every non-blank netlist line in one regex pass."""
+    return list(_iter_line_kinds(text))
+
+
+def _find_subckt_bounds(text):
+    """Return (start, end) line indices of the first subcircuit, stopping at its .ends."""
+    start = None
+    for i, kind in _iter_line_kinds(text):
+        if kind == SUBCKT:
+            start = i
+        elif kind == ENDS:
+            return start, i
+    return start, None
+
+
+# Netlist fixtures shared by the tests below
+_NETLIST_SIMPLE_SUBCKT = """.subckt opamp in_n in_p out
 	* opamp implementation
 .ends opamp
 XU2 S_in 0 S_out opamp Aol=100K GBW=10Meg
@@ -17,9 +53,89 @@ R1 S_out S_in R
 .backanno
 .end
 """
+
+_NETLIST_MULTI_SUBCKT = """.subckt opamp1 in_n in_p out
+	* opamp1 implementation
+.ends opamp1
+.subckt opamp2 in_n in_p out
+	* opamp2 implementation
+.ends opamp2
+R1 S_out S_in R
+XU1 S_in 0 S_out opamp1
+XU2 S_in 0 S_out opamp2
+.end
+"""
+
+_NETLIST_SUBCKT_MOS = """.subckt opamp in_n in_p out
+	* opamp implementation
+M1 out in_n VDD VSS nch W=1u L=0.18u
+M2 out in_p VDD VSS nch W=1u L=0.18u
+.ends opamp
+R1 S_out S_in R
+.end
+"""
+
+_NETLIST_DEVICES_ONLY = """R1 A B R
+R2 B C R
+R3 C D R
+.backanno
+.end
+"""
+
+_NETLIST_DET = """.subckt opamp in_n in_p out
+	* opamp implementation
+.ends opamp
+R1 S_out S_in R
+R2 A B R
+C1 S_out S_in C
+.backanno
+.end
+"""
+
+_NETLIST_CONT = """.subckt opamp in_n in_p out
+	* opamp implementation
++ with continuation
+R1 A B R
++ more continuation
+.ends opamp
+R2 S_out S_in R
+.end
+"""
+
+_NETLIST_BLANK = """.subckt opamp in_n in_p out
+* comment before blank line
+
+M1 out in_n VDD VSS nch W=1u L=0.18u
+
+M2 out in_p VDD VSS nch W=1u L=0.18u
+* comment after blank line
+.ends opamp
+R1 S_out S_in R
+.end
+"""
+
+_NETLIST_FOOTER = """.end
+R1 A B R
+.backanno
+R2 C D R
+.end
+"""
+
+_NETLIST_HEADER = """.model nch nmos
+.param VDD=1.8
+R1 A B R
+.end
+"""
+
+
+class TestRandomizeSpice(unittest.TestCase):
+    """Test that randomize_spice preserves subcircuit definitions."""
+
+    def test_subcircuit_not_shuffled(self):
+        """Test that .subckt/.ends blocks are preserved in order and not shuffled."""
         # Run multiple times with same seed to verify determinism
-        result1 = randomize_spice(netlist, seed=42)
-        result2 = randomize_spice(netlist, seed=42)
+        result1 = randomize_spice(_NETLIST_SIMPLE_SUBCKT, seed=42)
+        result2 = randomize_spice(_NETLIST_SIMPLE_SUBCKT, seed=42)
         
         # Should be deterministic with same seed
         self.assertEqual(result1, result2)
@@ -30,14 +146,13 @@ R1 S_out S_in R
         subckt_end_idx = None
         device_start_idx = None
         
-        for i, line in enumerate(lines1):
-            if line.strip().lower().startswith('.subckt'):
+        for i, kind in _classify_lines(result1):
+            if kind == SUBCKT:
                 subckt_start_idx = i
-            if line.strip().lower().startswith('.ends'):
+            elif kind == ENDS:
                 subckt_end_idx = i
-            if line.strip().startswith('X') or line.strip().startswith('R'):
-                if device_start_idx is None:
-                    device_start_idx = i
+            elif kind == DEVICE and device_start_idx is None:
+                device_start_idx = i
         
         self.assertIsNotNone(subckt_start_idx, "Subcircuit definition not found")
         self.assertIsNotNone(subckt_end_idx, "Subcircuit end not found")
@@ -56,32 +171,19 @@ R1 S_out S_in R
 
     def test_multiple_subcircuits_preserved(self):
         """Test that multiple subcircuit definitions are all preserved."""
-        netlist = """.subckt opamp1 in_n in_p out
-	* opamp1 implementation
-.ends opamp1
-.subckt opamp2 in_n in_p out
-	* opamp2 implementation
-.ends opamp2
-R1 S_out S_in R
-XU1 S_in 0 S_out opamp1
-XU2 S_in 0 S_out opamp2
-.end
-"""
-        result = randomize_spice(netlist, seed=123)
-        lines = result.splitlines()
+        result = randomize_spice(_NETLIST_MULTI_SUBCKT, seed=123)
         
         # Find all subcircuit definitions
         subckt_starts = []
         subckt_ends = []
         device_indices = []
         
-        for i, line in enumerate(lines):
-            stripped = line.strip().lower()
-            if stripped.startswith('.subckt'):
+        for i, kind in _classify_lines(result):
+            if kind == SUBCKT:
                 subckt_starts.append(i)
-            elif stripped.startswith('.ends'):
+            elif kind == ENDS:
                 subckt_ends.append(i)
-            elif stripped.startswith(('r', 'x', 'm', 'c', 'l')):
+            elif kind == DEVICE:
                 device_indices.append(i)
         
         # Should have found both subcircuits
@@ -97,27 +199,11 @@ XU2 S_in 0 S_out opamp2
 
     def test_subcircuit_content_not_modified(self):
         """Test that content within subcircuit blocks is not modified."""
-        netlist = """.subckt opamp in_n in_p out
-	* opamp implementation
-M1 out in_n VDD VSS nch W=1u L=0.18u
-M2 out in_p VDD VSS nch W=1u L=0.18u
-.ends opamp
-R1 S_out S_in R
-.end
-"""
-        result = randomize_spice(netlist, seed=456)
+        result = randomize_spice(_NETLIST_SUBCKT_MOS, seed=456)
         
         # Extract subcircuit block
         lines = result.splitlines()
-        subckt_start = None
-        subckt_end = None
-        
-        for i, line in enumerate(lines):
-            if line.strip().lower().startswith('.subckt'):
-                subckt_start = i
-            elif line.strip().lower().startswith('.ends'):
-                subckt_end = i
-                break
+        subckt_start, subckt_end = _find_subckt_bounds(result)
         
         self.assertIsNotNone(subckt_start)
         self.assertIsNotNone(subckt_end)
@@ -131,15 +217,9 @@ R1 S_out S_in R
 
     def test_device_statements_shuffled(self):
         """Test that device statements (outside subcircuits) are shuffled."""
-        netlist = """R1 A B R
-R2 B C R
-R3 C D R
-.backanno
-.end
-"""
         # Run with different seeds to verify shuffling
-        result1 = randomize_spice(netlist, seed=100)
-        result2 = randomize_spice(netlist, seed=200)
+        result1 = randomize_spice(_NETLIST_DEVICES_ONLY, seed=100)
+        result2 = randomize_spice(_NETLIST_DEVICES_ONLY, seed=200)
         
         lines1 = [l.strip() for l in result1.splitlines() if l.strip()]
         lines2 = [l.strip() for l in result2.splitlines() if l.strip()]
@@ -156,45 +236,20 @@ R3 C D R
 
     def test_deterministic_with_same_seed(self):
         """Test that same seed produces same output."""
-        netlist = """.subckt opamp in_n in_p out
-	* opamp implementation
-.ends opamp
-R1 S_out S_in R
-R2 A B R
-C1 S_out S_in C
-.backanno
-.end
-"""
-        result1 = randomize_spice(netlist, seed=999)
-        result2 = randomize_spice(netlist, seed=999)
-        result3 = randomize_spice(netlist, seed=999)
+        result1 = randomize_spice(_NETLIST_DET, seed=999)
+        result2 = randomize_spice(_NETLIST_DET, seed=999)
+        result3 = randomize_spice(_NETLIST_DET, seed=999)
         
         self.assertEqual(result1, result2)
         self.assertEqual(result2, result3)
 
     def test_subcircuit_with_continuation_lines(self):
         """Test that continuation lines within subcircuits are preserved."""
-        netlist = """.subckt opamp in_n in_p out
-	* opamp implementation
-+ with continuation
-R1 A B R
-+ more continuation
-.ends opamp
-R2 S_out S_in R
-.end
-"""
-        result = randomize_spice(netlist, seed=777)
+        result = randomize_spice(_NETLIST_CONT, seed=777)
         lines = result.splitlines()
         
         # Find subcircuit block
-        subckt_start = None
-        subckt_end = None
-        for i, line in enumerate(lines):
-            if line.strip().lower().startswith('.subckt'):
-                subckt_start = i
-            elif line.strip().lower().startswith('.ends'):
-                subckt_end = i
-                break
+        subckt_start, subckt_end = _find_subckt_bounds(result)
         
         self.assertIsNotNone(subckt_start)
         self.assertIsNotNone(subckt_end)
@@ -211,30 +266,12 @@ R2 S_out S_in R
         to the end of the netlist. Blank lines inside subcircuits must remain in place
         to preserve SPICE simulator compatibility.
         """
-        # Create a subcircuit with blank lines at specific positions
-        netlist = """.subckt opamp in_n in_p out
-* comment before blank line
-
-M1 out in_n VDD VSS nch W=1u L=0.18u
-
-M2 out in_p VDD VSS nch W=1u L=0.18u
-* comment after blank line
-.ends opamp
-R1 S_out S_in R
-.end
-"""
-        result = randomize_spice(netlist, seed=888)
+        # Subcircuit with blank lines at specific positions
+        result = randomize_spice(_NETLIST_BLANK, seed=888)
         lines = result.splitlines()
         
         # Find subcircuit block
-        subckt_start = None
-        subckt_end = None
-        for i, line in enumerate(lines):
-            if line.strip().lower().startswith('.subckt'):
-                subckt_start = i
-            elif line.strip().lower().startswith('.ends'):
-                subckt_end = i
-                break
+        subckt_start, subckt_end = _find_subckt_bounds(result)
         
         self.assertIsNotNone(subckt_start, "Subcircuit start not found")
         self.assertIsNotNone(subckt_end, "Subcircuit end not found")
@@ -303,29 +340,18 @@ R1 S_out S_in R
 
     def test_footer_directives_at_end(self):
         """Test that footer directives like .end and .backanno are placed at the end."""
-        netlist = """.end
-R1 A B R
-.backanno
-R2 C D R
-.end
-"""
-        result = randomize_spice(netlist, seed=9999)
-        lines = result.splitlines()
-        
-        # Footer directives should be at the end
-        # Find last non-blank lines
-        non_blank_lines = [line for line in lines if line.strip()]
+        result = randomize_spice(_NETLIST_FOOTER, seed=9999)
         
         # .end and .backanno should be among the last lines
         # They should come after device statements
         device_indices = []
         footer_indices = []
         
-        for i, line in enumerate(lines):
-            stripped = line.strip().lower()
-            if stripped.startswith(('.end', '.backanno')):
+        kinds = _classify_lines(result)
+        for i, kind in kinds:
+            if kind == FOOTER:
                 footer_indices.append(i)
-            elif stripped and not stripped.startswith(('*', ';', '.')):
+            elif kind in _STATEMENT_KINDS:
                 # Device statement (not comment, not dot-directive)
                 device_indices.append(i)
         
@@ -337,25 +363,15 @@ R2 C D R
                                   "Footer directives (.end, .backanno) should come after device statements")
         
         # Verify .end appears at the end
-        last_non_blank = None
-        for i in range(len(lines) - 1, -1, -1):
-            if lines[i].strip():
-                last_non_blank = lines[i].strip().lower()
-                break
-        
-        if last_non_blank:
-            self.assertTrue(last_non_blank.startswith('.end') or last_non_blank.startswith('.backanno'),
-                          f"Last directive should be .end or .backanno, got: {last_non_blank}")
+        if kinds:
+            last_idx, last_kind = kinds[-1]
+            if last_kind != FOOTER:
+                last_non_blank = result.splitlines()[last_idx].strip().lower()
+                self.fail(f"Last directive should be .end or .backanno, got: {last_non_blank}")
 
     def test_header_directives_at_start(self):
         """Test that header directives like .model and .param stay in headers."""
-        netlist = """.model nch nmos
-.param VDD=1.8
-R1 A B R
-.end
-"""
-        result = randomize_spice(netlist, seed=8888)
-        lines = result.splitlines()
+        result = randomize_spice(_NETLIST_HEADER, seed=8888)
         
         # Find positions
         model_idx = None
@@ -363,16 +379,15 @@ R1 A B R
         device_idx = None
         end_idx = None
         
-        for i, line in enumerate(lines):
-            stripped = line.strip().lower()
-            if stripped.startswith('.model'):
+        for i, kind in _classify_lines(result):
+            if kind == MODEL:
                 model_idx = i
-            elif stripped.startswith('.param'):
+            elif kind == PARAM:
                 param_idx = i
-            elif stripped.startswith('r') and not stripped.startswith(('.end', '.backanno')):
+            elif kind == DEVICE:
                 if device_idx is None:
                     device_idx = i
-            elif stripped.startswith('.end'):
+            elif kind == FOOTER:
                 end_idx = i
         
         # .model and .param should come before devices
@@ -1,116 +1,197 @@
 from __future__ import annotations
 
+import heapq
 import json
 import os
 import sys
 import threading
 import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Optional, Tuple
+from time import perf_counter
+from typing import Any, Iterator, NamedTuple, Optional, Tuple
+
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Compact UTF-8 JSON encoding plus a trailing newline (one JSONL row); uses orjson when installed."""
+
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
 
 
 _TRUE_STRINGS = {"1", "true", "yes", "on"}
 _ENABLE_ENV_KEY = "ENABLE_PROFILING"
+_STDERR_ENV_KEY = "PROFILE_STDERR"
+_MAX_ENTRIES_ENV_KEY = "PROFILE_MAX_ENTRIES"
 
 
 def _env_enabled() -> bool:
     return os.getenv(_ENABLE_ENV_KEY, "").strip().lower() in _TRUE_STRINGS
 
 
-_ENABLED: bool = _env_enabled()
-_ENTRIES: list[dict[str, object]] = []
+def _env_max_entries() -> Optional[int]:
+    raw = os.getenv(_MAX_ENTRIES_ENV_KEY, "100000").strip()
+    try:
+        value = int(raw)
+    except ValueError:
+        return 100000
+    return value if value > 0 else None
+
+
+class _Entry(NamedTuple):
+    timestamp: int  # ns since epoch, from the monotonic clock anchored at import
+    component: str
+    operation: str
+    duration_ms: float
+    context: str
+    thread_id: int
+
+
+# Offset that maps perf_counter_ns() onto wall-clock epoch ns, so timestamps stay
+# comparable across runs but never go backwards within one
+_EPOCH_OFFSET_NS: int = time.time_ns() - time.perf_counter_ns()
+# Live [PROFILE] lines on stderr; set PROFILE_STDERR=0 to only collect the JSONL report
+_STDERR: bool = os.getenv(_STDERR_ENV_KEY, "1").strip().lower() in _TRUE_STRINGS
+# Public so hot call sites can test `profiling.PROFILE` and skip the call entirely
+PROFILE: bool = _env_enabled()
+# Per-thread ring buffer size; the oldest entries are dropped once a thread has
+# logged more than this. PROFILE_MAX_ENTRIES<=0 keeps everything.
+_MAX_ENTRIES: Optional[int] = _env_max_entries()
+# Each thread appends to its own buffer without locking; _LOCK only guards
+# registration of new buffers and the drain in write_reports().
+_TLS = threading.local()
+_BUFFERS: list[deque[_Entry]] = []
 _LOCK = threading.Lock()
 
 
+def _thread_buffer() -> deque[_Entry]:
+    buf = getattr(_TLS, "buf", None)
+    if buf is None:
+        buf = deque(maxlen=_MAX_ENTRIES)
+        _TLS.buf = buf
+        _TLS.tid = threading.get_ident()
+        with _LOCK:
+            _BUFFERS.append(buf)
+    return buf
+
+
 def is_enabled() -> bool:
     """Return whether profiling logs are enabled."""
 
-    return _ENABLED
+    return PROFILE
 
 
 def set_enabled(value: bool) -> None:
     """Enable/disable profiling globally and synchronize the env var."""
 
-    global _ENABLED
-    _ENABLED = bool(value)
-    if _ENABLED:
+    global PROFILE
+    PROFILE = bool(value)
+    if PROFILE:
         os.environ[_ENABLE_ENV_KEY] = "1"
     else:
         os.environ.pop(_ENABLE_ENV_KEY, None)
     with _LOCK:
-        _ENTRIES.clear()
+        for buf in _BUFFERS:
+            buf.clear()
 
 
 def log(component: str, operation: str, duration_ms: float, context: Optional[str] = None) -> None:
     """Emit a formatted profiling log line if profiling is enabled."""
 
-    if not _ENABLED:
+    if not PROFILE:
         return
-    entry = {
-        "timestamp": time.time(),
-        "component": component,
-        "operation": operation,
-        "duration_ms": float(duration_ms),
-        "context": context or "",
-        "thread_id": threading.get_ident(),
-    }
-    with _LOCK:
-        _ENTRIES.append(entry)
-    suffix = f" {context}" if context else ""
-    print(f"[PROFILE] {component} {operation} {duration_ms:.1f}ms{suffix}", file=sys.stderr, flush=True)
+    dur = duration_ms if type(duration_ms) is float else float(duration_ms)
+    # _thread_buffer() also caches the thread id on _TLS
+    _thread_buffer().append(_Entry(_EPOCH_OFFSET_NS + time.perf_counter_ns(), component, operation, dur, context or "", _TLS.tid))
+    if _STDERR:
+        # sys.stderr is line-buffered, so each line is still one write; PROFILE_STDERR=0 skips them
+        if context:
+            sys.stderr.write(f"[PROFILE] {component} {operation} {dur:.1f}ms {context}\n")
+        else:
+            sys.stderr.write(f"[PROFILE] {component} {operation} {dur:.1f}ms\n")
+
+
+@contextmanager
+def section(component: str, operation: str, context: Optional[str] = None) -> Iterator[None]:
+    """Time the enclosed block and log it (also on exceptions); no-op when profiling is disabled."""
+
+    if not PROFILE:
+        yield
+        return
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        log(component, operation, (perf_counter() - start) * 1000, context=context)
+
+
+def _consume(entries: deque[_Entry]) -> Iterator[_Entry]:
+    popleft = entries.popleft
+    while entries:
+        yield popleft()
 
 
 def write_reports(output_dir: Path) -> Tuple[Optional[Path], Optional[Path]]:
-    """Persist profiling entries and return paths to log and summary files."""
+    """Persist (and drain) profiling entries and return paths to log and summary files."""
 
-    if not _ENABLED:
+    if not PROFILE:
         return (None, None)
+    # Move entries out of the per-thread buffers instead of copying them, so peak
+    # memory stays at one copy. Owners may still append concurrently; anything
+    # logged after the length snapshot stays buffered for the next report.
     with _LOCK:
-        entries = list(_ENTRIES)
-    if not entries:
+        drained: list[deque[_Entry]] = []
+        for buf in _BUFFERS:
+            popleft = buf.popleft
+            drained.append(deque([popleft() for _ in range(len(buf))]))
+    if not any(drained):
         return (None, None)
 
     output_dir.mkdir(parents=True, exist_ok=True)
     log_path = output_dir / "profiling_log.jsonl"
     summary_path = output_dir / "profiling_summary.txt"
 
-    with log_path.open("w", encoding="utf-8") as f:
-        for entry in entries:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
-
-    # Aggregate statistics by component+operation
-    aggregates: dict[tuple[str, str], dict[str, float]] = {}
-    for entry in entries:
-        key = (entry["component"], entry["operation"])
-        agg = aggregates.setdefault(key, {"count": 0.0, "total_ms": 0.0, "max_ms": 0.0})
-        dur = float(entry["duration_ms"])
-        agg["count"] += 1
-        agg["total_ms"] += dur
-        if dur > agg["max_ms"]:
-            agg["max_ms"] = dur
+    # Single pass over the chronological merge (per-thread buffers are already
+    # time-ordered): write each JSONL line as it is encoded and aggregate
+    # [count, total_ms, max_ms] by component+operation together. Entries are
+    # popped as they are merged, so written entries can be freed right away.
+    aggregates: defaultdict[tuple[str, str], list[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+    with log_path.open("wb") as f:
+        write = f.write
+        for entry in heapq.merge(*map(_consume, drained), key=attrgetter("timestamp")):
+            write(_dumps_line(entry._asdict()))
+            agg = aggregates[(entry.component, entry.operation)]
+            dur = entry.duration_ms
+            agg[0] += 1
+            agg[1] += dur
+            if dur > agg[2]:
+                agg[2] = dur
 
     # Write summary sorted by descending total duration
     rows = sorted(
-        [
-            (
-                comp,
-                op,
-                stats["count"],
-                stats["total_ms"],
-                stats["total_ms"] / stats["count"],
-                stats["max_ms"],
-            )
-            for (comp, op), stats in aggregates.items()
-        ],
-        key=lambda item: item[3],
+        (
+            (comp, op, count, total_ms, total_ms / count, max_ms)
+            for (comp, op), (count, total_ms, max_ms) in aggregates.items()
+        ),
+        key=itemgetter(3),
         reverse=True,
     )
 
-    with summary_path.open("w", encoding="utf-8") as f:
+    with summary_path.open("w", encoding="utf-8", buffering=1 << 16) as f:
         f.write("Component\tOperation\tCount\tTotal ms\tAvg ms\tMax ms\n")
-        for comp, op, count, total_ms, avg_ms, max_ms in rows:
-            f.write(
+        f.writelines(
+            [
                 f"{comp}\t{op}\t{int(count)}\t{total_ms:.1f}\t{avg_ms:.1f}\t{max_ms:.1f}\n"
-            )
+                for comp, op, count, total_ms, avg_ms, max_ms in rows
+            ]
+        )
 
     return (log_path, summary_path)
@@ -6,6 +6,10 @@ from typing import Optional, Dict
 
 from . import profiling
 
+# Safety cap on a single sleep in acquire(); waits are computed from the refill rate, so this only
+# bounds how stale the limiter state can get during long saturation (e.g. a full-minute TPM refill).
+_MAX_WAIT_S = 60.0
+
 
 class TokenBucketLimiter:
     """
@@ -14,6 +18,20 @@ class TokenBucketLimiter:
     - If a capacity is <= 0, that dimension is disabled.
     """
 
+    __slots__ = (
+        "lock",
+        "cond",
+        "name",
+        "req_capacity",
+        "tok_capacity",
+        "req_tokens",
+        "tok_tokens",
+        "req_rate",
+        "tok_rate",
+        "last",
+        "disabled",
+    )
+
     def __init__(self, rpm: float = 0.0, tpm: float = 0.0, name: str | None = None):
         """
         Initialize the limiter with requests-per-minute (RPM) and tokens-per-minute (TPM) capacities and set up thread synchronization.
@@ -28,6 +46,7 @@ class TokenBucketLimiter:
             - Each bucket's current tokens start at 50% of its capacity to reduce an initial burst.
             - Refill rates are computed per second from the minute capacities.
             - A lock and associated condition variable are created for cross-thread coordination, and an initial timestamp is recorded for refilling.
+            - When both capacities are zero the limiter is marked disabled and acquire() returns without locking.
         """
         self.lock = threading.Lock()
         self.cond = threading.Condition(self.lock)
@@ -42,6 +61,8 @@ class TokenBucketLimiter:
         self.req_rate = self.req_capacity / 60.0
         self.tok_rate = self.tok_capacity / 60.0
         self.last = time.monotonic()
+        # both dimensions off: acquire() is a no-op
+        self.disabled = self.req_capacity <= 0 and self.tok_capacity <= 0
 
     def _refill(self) -> None:
         now = time.monotonic()
@@ -52,52 +73,62 @@ class TokenBucketLimiter:
         if self.tok_capacity > 0:
             self.tok_tokens = min(self.tok_capacity, self.tok_tokens + dt * self.tok_rate)
 
+    def _try_consume(self, token_cost: float, req_cost: float) -> float:
+        """
+        Refill, then consume both costs if every enabled bucket can cover them. Caller must hold the lock.
+
+        Returns:
+            float: 0.0 when the costs were consumed, otherwise the seconds until both buckets will have refilled enough.
+        """
+        self._refill()
+        need_req = max(0.0, req_cost - (self.req_tokens if self.req_capacity > 0 else req_cost))
+        need_tok = max(0.0, token_cost - (self.tok_tokens if self.tok_capacity > 0 else token_cost))
+        if need_req <= 0 and need_tok <= 0:
+            if self.req_capacity > 0:
+                self.req_tokens -= req_cost
+            if self.tok_capacity > 0:
+                self.tok_tokens -= token_cost
+            return 0.0
+        # time to next availability for each bucket; both must be satisfied
+        wait_req = need_req / self.req_rate if (need_req > 0 and self.req_rate > 0) else 0.0
+        wait_tok = need_tok / self.tok_rate if (need_tok > 0 and self.tok_rate > 0) else 0.0
+        return max(wait_req, wait_tok)
+
     def acquire(self, token_cost: float, req_cost: float = 1.0, enable_profiling: bool = False) -> None:
         """
         Block until both token and request buckets have enough capacity, then consume the requested amounts.
         
-        If a bucket's configured capacity is less than or equal to zero, that bucket is ignored (no limiting for that dimension). This method may sleep while waiting for tokens to refill.
+        If a bucket's configured capacity is less than or equal to zero, that bucket is ignored (no limiting for that dimension). This method may sleep while waiting for tokens to refill; each sleep lasts until the slower bucket is expected to have refilled (capped at _MAX_WAIT_S) rather than polling.
         
         Parameters:
             token_cost (float): Estimated number of tokens required for the operation (e.g., prompt + completion).
             req_cost (float): Number of request units to consume (defaults to 1.0).
         """
-        timer = perf_counter() if enable_profiling and profiling.is_enabled() else None
-        with self.cond:
-            while True:
-                self._refill()
-                need_req = max(0.0, req_cost - (self.req_tokens if self.req_capacity > 0 else req_cost))
-                need_tok = max(0.0, token_cost - (self.tok_tokens if self.tok_capacity > 0 else token_cost))
-                if need_req <= 0 and need_tok <= 0:
-                    # consume
-                    if self.req_capacity > 0:
-                        self.req_tokens -= req_cost
-                    if self.tok_capacity > 0:
-                        self.tok_tokens -= token_cost
-                    return
-                # compute time to next availability for each bucket
-                wait_req = (
-                    (need_req / self.req_rate)
-                    if (self.req_capacity > 0 and self.req_rate > 0 and need_req > 0)
-                    else 0.0
-                )
-                wait_tok = (
-                    (need_tok / self.tok_rate)
-                    if (self.tok_capacity > 0 and self.tok_rate > 0 and need_tok > 0)
-                    else 0.0
-                )
-                wait_s = max(wait_req, wait_tok, 0.01)
-                # Only log significant waits (>5s) to reduce spam
-                if wait_s > 5.0:
-                    try:
-                        print(
-                            f"[rate-limit] {self.name}: sleeping ~{wait_s:.1f}s "
-                            f"(need tok={need_tok:.0f}; cap tpm={self.tok_capacity:.0f}/m)",
-                            flush=True
-                        )
-                    except Exception:
-                        pass
-                self.cond.wait(timeout=min(max(wait_req, 0.01), max(wait_tok, 0.01), 30.0))
+        if self.disabled:
+            return
+        timer = perf_counter() if enable_profiling and profiling.PROFILE else None
+        # Fast path: when tokens are available, take the plain mutex (shared with cond) and
+        # skip the Condition wrapper entirely
+        with self.lock:
+            wait_s = self._try_consume(token_cost, req_cost)
+        if wait_s > 0:
+            with self.cond:
+                while True:
+                    wait_s = self._try_consume(token_cost, req_cost)
+                    if wait_s <= 0:
+                        break
+                    # Only log significant waits (>5s) to reduce spam
+                    if wait_s > 5.0:
+                        need_tok = max(0.0, token_cost - self.tok_tokens) if self.tok_capacity > 0 else 0.0
+                        try:
+                            print(
+                                f"[rate-limit] {self.name}: sleeping ~{wait_s:.1f}s "
+                                f"(need tok={need_tok:.0f}; cap tpm={self.tok_capacity:.0f}/m)",
+                                flush=True
+                            )
+                        except Exception:
+                            pass
+                    self.cond.wait(timeout=min(wait_s, _MAX_WAIT_S))
         if timer is not None:
             elapsed_ms = (perf_counter() - timer) * 1000
             if elapsed_ms > 10:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import re
+from functools import lru_cache
 from typing import Dict, Optional
 from pathlib import Path
 
@@ -8,14 +9,33 @@ _PATH_RE = re.compile(r"\{path:([^}]+)\}")
 _MODMUX_RE = re.compile(r"\{modmux:([a-zA-Z0-9_]+)\}")
 _RUNTIME_RE = re.compile(r"\{runtime:([a-zA-Z0-9_]+)\}")
 
+
+class MissingRuntimeVariableError(ValueError):
+    """Raised when a {runtime:key} directive has no binding in vars; the key is kept on .key."""
+
+    def __init__(self, key: str):
+        super().__init__(f"Runtime variable '{key}' not found in vars")
+        self.key = key
+
+
+@lru_cache(maxsize=256)
+def _read_include(path: str, mtime_ns: int) -> str:
+    """Read an include file; keyed on mtime so edited files are re-read."""
+    # One binary read + decode; newlines are only translated if the file has any '\r'
+    text = Path(path).read_bytes().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 def render_template(text: str, vars: Dict[str, str], base_dir: Optional[str | Path] = None, modality: Optional[str] = None) -> str:
     """Render a lightweight bracket-template by:
     1) Resolving include directives of the form {path:relative/or/absolute.md} relative to base_dir
     2) Resolving modality multiplexing directives of the form {modmux:key} which look up key_SPICE, key_CASIR, or key_CASCODE based on modality
-    3) Resolving runtime variable directives of the form {runtime:key} which look up key directly in vars (raises ValueError if missing)
+    3) Resolving runtime variable directives of the form {runtime:key} which look up key directly in vars (raises MissingRuntimeVariableError if missing)
     4) Replacing {var} placeholders with provided string values.
     Missing variables are left as-is to surface gaps during validation.
-    Runtime variables must be present or ValueError is raised.
+    Runtime variables must be present or MissingRuntimeVariableError (a ValueError) is raised.
     Includes are resolved recursively.
     """
     base = Path(base_dir) if base_dir is not None else None
@@ -33,26 +53,28 @@ def render_template(text: str, vars: Dict[str, str], base_dir: Optional[str | Pa
     def _resolve_includes(s: str, depth: int = 0) -> str:
         if depth > 8:
             raise ValueError(f"Include depth exceeds limit (possible circular dependency)")
-        out = s
-        for m in list(_PATH_RE.finditer(s)):
-            raw = m.group(0)
+
+        def repl(m: re.Match[str]) -> str:
             rel = m.group(1).strip()
             try:
                 p = Path(rel)
                 if not p.is_absolute() and base is not None:
                     p = (base / p).resolve()
-                if not p.exists():
-                    raise FileNotFoundError(f"Include not found: {rel} (resolved to {p})")
-                content = p.read_text(encoding="utf-8")
-                content = _resolve_includes(content, depth + 1)
-                out = out.replace(raw, content)
+                try:
+                    mtime_ns = p.stat().st_mtime_ns
+                except FileNotFoundError:
+                    raise FileNotFoundError(f"Include not found: {rel} (resolved to {p})") from None
+                content = _read_include(str(p), mtime_ns)
+                return _resolve_includes(content, depth + 1)
             except FileNotFoundError:
                 # Re-raise FileNotFoundError for missing includes
                 raise
             except Exception as exc:
                 # Wrap other exceptions with context
                 raise RuntimeError(f"Failed to read include {rel}: {exc}") from exc
-        return out
+
+        # Single pass: each directive is replaced where it occurs, without rescanning the output
+        return _PATH_RE.sub(repl, s)
 
     # 1) includes
     with_includes = _resolve_includes(text)
@@ -76,7 +98,7 @@ def render_template(text: str, vars: Dict[str, str], base_dir: Optional[str | Pa
     # 3) runtime variables
     def _resolve_runtime(s: str) -> str:
         """Resolve {runtime:key} directives by looking up key directly in vars.
-        Raises ValueError if key is missing."""
+        Raises MissingRuntimeVariableError if key is missing."""
         last_end = 0
         parts = []
         for m in _RUNTIME_RE.finditer(s):
@@ -85,7 +107,7 @@ def render_template(text: str, vars: Dict[str, str], base_dir: Optional[str | Pa
             if key in vars:
                 parts.append(str(vars[key]))
             else:
-                raise ValueError(f"Runtime variable '{key}' not found in vars")
+                raise MissingRuntimeVariableError(key)
             last_end = m.end()
         parts.append(s[last_end:])
         return "".join(parts)
@@ -93,9 +115,12 @@ def render_template(text: str, vars: Dict[str, str], base_dir: Optional[str | Pa
     with_runtime = _resolve_runtime(with_modmux)
     
     # 4) variables
+    get = vars.get
+
     def _sub(m: re.Match[str]) -> str:
-        key = m.group(1)
-        return str(vars.get(key, m.group(0)))
+        val = get(m.group(1), m.group(0))
+        # Values are normally already strings (YAML vars are stringified upstream)
+        return val if type(val) is str else str(val)
     rendered = _VAR_RE.sub(_sub, with_runtime)
     
     # 5) Check for unresolved includes (should not happen if _resolve_includes worked correctly)
@@ -4,20 +4,14 @@ from typing import Iterable, List, Tuple
 
 
 def contains_any(text: str, patterns: Iterable[str]) -> bool:
+    # Patterns are literals, so a plain substring check is enough
     t = text.lower()
-    for p in patterns:
-        if re.search(re.escape(p.lower()), t):
-            return True
-    return False
+    return any(p.lower() in t for p in patterns)
 
 
 def count_any(text: str, patterns: Iterable[str]) -> int:
     t = text.lower()
-    cnt = 0
-    for p in patterns:
-        if re.search(re.escape(p.lower()), t):
-            cnt += 1
-    return cnt
+    return sum(1 for p in patterns if p.lower() in t)
 
 
 code_id_re = re.compile(r"`([A-Za-z0-9_./-]+)`")
@@ -25,33 +19,23 @@ token_id_re = re.compile(r"\b([A-Za-z]{1,4}[0-9]{1,3}|CMFB|CL|Cc|VDD|VSS|GND|vin
 
 
 def extract_citations(answer: str) -> List[str]:
-    ids = []
-    ids += code_id_re.findall(answer)
-    ids += token_id_re.findall(answer)
-    # Keep unique order
-    seen = set()
-    uniq = []
-    for i in ids:
-        if i not in seen:
-            seen.add(i)
-            uniq.append(i)
-    return uniq
+    # Code-quoted ids first, then bare tokens; dict.fromkeys keeps first-seen order
+    return list(dict.fromkeys(code_id_re.findall(answer) + token_id_re.findall(answer)))
+
+
+# Header lines: optional indentation, then '#...' to end of line
+section_header_re = re.compile(r"^([^\S\n]*)(#.*)$", re.MULTILINE)
 
 
 def sectionize_markdown(answer: str) -> List[Tuple[str, str]]:
-    # Very lightweight section splitter by leading markdown headers
+    # Very lightweight section splitter by leading markdown headers.
+    # Rejoin on '\n' first so every splitlines() boundary ('\r\n', '\r', '\f', '\u2028', ...) is a line break
+    # split() yields [preamble, indent1, header1, body1, indent2, header2, body2, ...]
+    chunks = section_header_re.split("\n".join(answer.splitlines()))
     parts: List[Tuple[str, str]] = []
-    current = None
-    buf: List[str] = []
-    for line in answer.splitlines():
-        if line.strip().startswith('#'):
-            if current is not None:
-                parts.append((current, "\n".join(buf).strip()))
-            current = re.sub(r"^#+\s*", "", line).strip().lower()
-            buf = []
-        else:
-            buf.append(line)
-    if current is not None:
-        parts.append((current, "\n".join(buf).strip()))
+    for i in range(1, len(chunks), 3):
+        indent, header, body = chunks[i], chunks[i + 1], chunks[i + 2]
+        # Only unindented headers get their leading '#'s stripped
+        title = header if indent else re.sub(r"^#+\s*", "", header)
+        parts.append((title.strip().lower(), body.strip()))
     return parts
-
@@ -1,5 +1,9 @@
 from __future__ import annotations
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import List
 from rich import print
 
 try:
@@ -10,38 +14,50 @@ except Exception:
     from harness.run_eval import load_questions  # type: ignore
 
 
-def audit_item(item_dir: Path) -> bool:
-    ok = True
-    qfile = item_dir / "questions.yaml"
-    if not qfile.exists():
-        print(f"[red]Missing questions.yaml[/red] in {item_dir}")
-        return False
+@lru_cache(maxsize=None)
+def _path_exists(path: Path) -> bool:
+    # Prompt templates are shared by every item in a family; stat each one once
+    return path.exists()
+
+
+def audit_item(item_dir: Path) -> List[str]:
+    """Audit one item directory; returns its problems as printable lines (empty when it passes)."""
+    problems: List[str] = []
+    # One directory read instead of a stat() per top-level file check; dangling symlinks
+    # are left out so they are reported missing, as exists() would
+    with os.scandir(item_dir) as it:
+        names = {e.name for e in it if not (e.is_symlink() and not os.path.exists(e.path))}
+    if "questions.yaml" not in names:
+        return [f"[red]Missing questions.yaml[/red] in {item_dir}"]
     try:
         questions = load_questions(item_dir)
     except Exception as exc:
-        print(f"[red]Failed to load questions for {item_dir}[/red]: {exc}")
-        return False
+        return [f"[red]Failed to load questions for {item_dir}[/red]: {exc}"]
 
     prompts_dir = item_dir.parent / "prompts"
     for q in questions:
         pt = prompts_dir / q.prompt_template
-        if not pt.exists():
-            print(f"[red]Missing prompt template[/red] {pt}")
-            ok = False
+        if not _path_exists(pt):
+            problems.append(f"[red]Missing prompt template[/red] {pt}")
         rpath = item_dir / q.judge_prompt
         if not rpath.exists():
-            print(f"[red]Missing rubric file[/red] {rpath}")
-            ok = False
+            problems.append(f"[red]Missing rubric file[/red] {rpath}")
         apath = item_dir / q.artifact_path
-        if not apath.exists():
-            print(f"[red]Missing artifact[/red] {apath}")
-            ok = False
-    return ok
+        # Plain filenames can be answered from the directory listing; '', '.', '..' and
+        # anything with a separator still need a real stat
+        ap = q.artifact_path
+        if ap not in ("", ".", "..") and "/" not in ap and os.sep not in ap:
+            found = ap in names
+        else:
+            found = apath.exists()
+        if not found:
+            problems.append(f"[red]Missing artifact[/red] {apath}")
+    return problems
 
 
 def main():
     root = Path("data")
-    bad = 0
+    items = []
     for split in ["train", "dev", "test"]:
         sdir = root/split
         if not sdir.exists():
@@ -52,8 +68,16 @@ def main():
             for item in family.iterdir():
                 if not item.is_dir():
                     continue
-                if not audit_item(item):
-                    bad += 1
+                items.append(item)
+    # Audits are dominated by stat()/file reads, which release the GIL. Workers only
+    # collect messages; printing here in item order keeps the report diffable.
+    bad = 0
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        for problems in ex.map(audit_item, items):
+            for line in problems:
+                print(line)
+            if problems:
+                bad += 1
     if bad:
         print(f"[red]{bad} issues found[/red]")
     else:
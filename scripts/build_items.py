@@ -5,12 +5,14 @@ This script demonstrates how to create new items by copying templates and
 randomizing IDs/labels. In v0 it prints guidance only.
 """
 
+import sys
 from pathlib import Path
-from rich import print
 
 
 def main():
-    print("[yellow]build_items.py[/yellow]: v0 stub — add topology generators here.")
+    # Colour only on a terminal, as rich did; redirected output stays plain
+    name = "\x1b[33mbuild_items.py\x1b[0m" if sys.stdout.isatty() else "build_items.py"
+    print(f"{name}: v0 stub — add topology generators here.")
     print("Guidance:")
     print("- Author inventory.json as the source of truth (elements, nets, blocks).")
     print("- Derive artifacts in-place: netlist.sp (and optionally veriloga.va, netlist.cas, netlist.cir).")
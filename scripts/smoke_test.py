@@ -1,17 +1,23 @@
 from __future__ import annotations
-import subprocess
+import runpy
 import sys
 
 
+def _run_script(path: str, *args: str) -> None:
+    """Run a script's __main__ in this interpreter (saves a Python startup + harness import per step)."""
+    saved_argv = sys.argv
+    sys.argv = [path, *args]
+    try:
+        runpy.run_path(path, run_name="__main__")
+    finally:
+        sys.argv = saved_argv
+
+
 def main():
     print("Validating judge prompt mapping for analysis/feedback...")
-    subprocess.check_call([
-        sys.executable,
-        "scripts/validate_judge_prompts.py",
-    ])
+    _run_script("scripts/validate_judge_prompts.py")
     print("Running dummy eval on dev split...")
-    subprocess.check_call([
-        sys.executable,
+    _run_script(
         "harness/run_eval.py",
         "--model",
         "dummy",
@@ -21,9 +27,9 @@ def main():
         "dev/analysis/feedback",
         "--max-items",
         "0",
-    ])  # 0 => all
+    )  # 0 => all
     print("Summarizing results...")
-    subprocess.check_call([sys.executable, "harness/reporting/summarize.py", "outputs/latest/results.jsonl"]) 
+    _run_script("harness/reporting/summarize.py", "outputs/latest/results.jsonl")
     print("Report index: outputs/latest/report/index.html")
 
 
@@ -1,33 +1,124 @@
 from __future__ import annotations
 
 import argparse
+import math
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from types import MappingProxyType
+from typing import Any, Iterator, List, Mapping, Tuple
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 import yaml
 
-from harness.utils.template import render_template
+from harness.utils.template import MissingRuntimeVariableError, render_template
 
+# libyaml-backed loader when available (same safe semantics as yaml.safe_load, much faster)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def _load_questions(path: Path) -> Iterable[dict]:
+# Same include/variable patterns as harness/utils/template.py
+_INCLUDE_RE = re.compile(r"\{path:([^}]+)\}")
+_UNREPLACED_RE = re.compile(r"\{([a-zA-Z0-9_]+)\}")
+
+# Runtime variables in rubric YAMLs and judge prompts are bound at runtime, so validation supplies
+# mock values. These are for OTA device swap debugging (runtime-generated).
+_MOCK_RUNTIME_VARS = MappingProxyType({
+    "swapped_id": "M1",
+    "from_type": "PMOS",
+    "to_type": "NMOS",
+    "bug_type": "device_polarity_swap",
+})
+
+# Below this many questions per subdirectory, worker start-up costs more than it saves
+_PARALLEL_MIN_QUESTIONS = 64
+# Questions handed to a pool worker per round trip
+_POOL_CHUNKSIZE = 16
+
+
+def _load_questions(path: Path) -> Iterator[dict]:
+    """Yield question entries from a questions.yaml without copying the parsed list."""
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+        data = yaml.load(path.read_bytes(), Loader=_YAML_LOADER)
     except Exception as exc:  # pragma: no cover - defensive
         raise SystemExit(f"Failed to load {path}: {exc}")
     if isinstance(data, dict):
         if "questions" in data and isinstance(data["questions"], list):
-            return data["questions"]
-        return [data]
-    if isinstance(data, list):
-        return data
-    raise SystemExit(f"questions.yaml must contain a list or mapping of questions: {path}")
+            yield from data["questions"]
+        else:
+            yield data
+    elif isinstance(data, list):
+        yield from data
+    else:
+        raise SystemExit(f"questions.yaml must contain a list or mapping of questions: {path}")
+
+
+def _slurp(path: str) -> str:
+    """Read a small UTF-8 text file with raw os.read calls, skipping the TextIOWrapper machinery.
+
+    Newlines are normalized to '\n' as read_text() would do.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # os.read may return short (network filesystems, a file still being written);
+        # keep reading until EOF so the text is never truncated
+        chunks = [os.read(fd, os.fstat(fd).st_size or 65536)]
+        while chunks[-1]:
+            chunks.append(os.read(fd, 65536))
+    finally:
+        os.close(fd)
+    text = b"".join(chunks).decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+@lru_cache(maxsize=4096)
+def _read_text_cached(path: str, mtime_ns: int) -> str:
+    return _slurp(path)
 
 
+@lru_cache(maxsize=4096)
+def _render_cached(path: str, mtime_ns: int, vars_items: frozenset) -> str:
+    text = _read_text_cached(path, mtime_ns)
+    if "{" not in text:
+        # Every directive starts with '{', so render_template would return the text unchanged
+        return text
+    return render_template(text, dict(vars_items), base_dir=Path(path).parent)
+
+
+def _render_file(path: Path, vars: Mapping[str, str]) -> str:
+    """Render a template file, reusing the result for identical (file, mtime, vars).
+
+    Shared judge prompts and rubric YAMLs are otherwise re-rendered for every question.
+    """
+    return _render_cached(str(path), path.stat().st_mtime_ns, frozenset(vars.items()))
+
+
+def _subdir_names(root: Path) -> List[str]:
+    """Names of root's child directories in sorted order, from a single os.scandir pass."""
+    with os.scandir(root) as it:
+        return sorted(e.name for e in it if e.is_dir())
+
+
+def _list_subdirs(root: Path) -> List[Path]:
+    """Child directories of root in name order."""
+    return [root / name for name in _subdir_names(root)]
+
+
+def _subdirs_with(root: Path, marker: str) -> List[Path]:
+    """Child directories of root that contain marker (a file or directory name)."""
+    # Filter on plain strings; only the survivors are wrapped in Path
+    root_s = os.fspath(root)
+    return [root / n for n in _subdir_names(root) if os.path.exists(os.path.join(root_s, n, marker))]
+
+
+@lru_cache(maxsize=2048)
 def _resolve_judge_path(item_dir: Path, judge_prompt: str) -> Tuple[Path, str]:
+    # Entries sharing a judge prompt resolve identically; memoize the resolve()/exists() probes
     rel = Path(judge_prompt)
     if rel.is_absolute():
         jpath = rel
@@ -56,12 +147,15 @@ def validate_template_includes(template_path: Path, base_dir: Path, visited: set
     visited.add(template_path)
     
     try:
-        content = template_path.read_text(encoding="utf-8")
+        content = _slurp(str(template_path))
     except Exception as exc:
         return [f"{template_path}: failed to read template ({exc})"]
     
-    # Use the same pattern as harness/utils/template.py
-    includes = re.findall(r"\{path:([^}]+)\}", content)
+    # Most templates have no includes; a substring scan is cheaper than running the regex
+    if "{path:" not in content:
+        return errors
+    
+    includes = _INCLUDE_RE.findall(content)
     
     for include in includes:
         include = include.strip()
@@ -82,20 +176,110 @@ def validate_template_includes(template_path: Path, base_dir: Path, visited: set
     return errors
 
 
-def validate_family(split_root: Path, family: str, family_subdir: str | None = None) -> List[str]:
-    """Validate a single family. Returns list of error messages."""
+@lru_cache(maxsize=1024)
+def _include_errors_cached(path: str, mtime_ns: int) -> Tuple[str, ...]:
+    template_path = Path(path)
+    return tuple(validate_template_includes(template_path, template_path.parent))
+
+
+def _include_errors(template_path: Path) -> Tuple[str, ...]:
+    """Include errors for a judge prompt, computed once per (file, mtime).
+
+    Questions sharing a prompt would otherwise re-walk the same include tree.
+    """
+    return _include_errors_cached(str(template_path), template_path.stat().st_mtime_ns)
+
+
+def _validate_question(item_dir: Path, q_path: Path, entry: Any) -> List[str]:
+    """Validate one questions.yaml entry. Returns list of error messages."""
+    errors: List[str] = []
+    if not isinstance(entry, dict):
+        return errors
+    judge_prompt = entry.get("judge_prompt")
+    if not judge_prompt:
+        prompt_template = entry.get("prompt_template")
+        if prompt_template:
+            judge_prompt = str(Path("../judge_prompts") / f"{Path(prompt_template).stem}.md")
+    if not judge_prompt:
+        errors.append(f"{q_path}: question {entry.get('id')} missing judge_prompt")
+        return errors
+    jpath, stem = _resolve_judge_path(item_dir, str(judge_prompt))
+    if not os.path.exists(jpath):
+        errors.append(f"{q_path}: judge prompt not found: {judge_prompt}")
+        return errors
+    
+    # Validate template includes before rendering
+    errors.extend(_include_errors(jpath))
+    
+    rubrics_dir = item_dir / "rubrics"
+    if not os.path.exists(rubrics_dir):
+        errors.append(f"{item_dir}: missing rubrics directory")
+        return errors
+    yaml_path = rubrics_dir / f"{stem}.yaml"
+    if not os.path.exists(yaml_path):
+        errors.append(f"{yaml_path}: missing YAML for judge prompt {stem}")
+        return errors
+    try:
+        # First, validate YAML syntax by rendering any template variables in the YAML itself
+        # Note: Runtime variables in YAML are expected at runtime, so we provide mock values for validation
+        try:
+            rendered_yaml = _render_file(yaml_path, _MOCK_RUNTIME_VARS)
+        except MissingRuntimeVariableError as exc:
+            errors.append(
+                f"{yaml_path}: missing runtime variable binding: {exc.key} "
+                f"(required at runtime, not in validation mock vars)"
+            )
+            # Skip further validation for this entry since we couldn't render the YAML
+            return errors
+        
+        yaml_data = yaml.load(rendered_yaml, Loader=_YAML_LOADER)
+        if yaml_data is None:
+            yaml_data = {}
+        
+        # Convert YAML data to string values for template rendering; mock runtime vars take precedence
+        yaml_vars = {**{k: str(v) for k, v in yaml_data.items()}, **_MOCK_RUNTIME_VARS}
+        
+        # Render the judge prompt template with the YAML data
+        # Note: Runtime variables (e.g., {runtime:swapped_id}) are provided at runtime,
+        # so we catch MissingRuntimeVariableError for missing runtime vars during validation
+        try:
+            judge_content = _render_file(jpath, yaml_vars)
+        except MissingRuntimeVariableError as exc:
+            errors.append(
+                f"{jpath}: missing runtime variable binding: {exc.key} "
+                f"(expected at runtime, not in validation mock vars)"
+            )
+            # Skip unreplaced-variable check for this prompt since we couldn't render it
+            return errors
+        
+        # Check for unreplaced template variables
+        # Use the same pattern as harness/utils/template.py: only alphanumeric + underscore
+        # Note: Runtime directives {runtime:key} are not matched by this regex (no colon in character class)
+        unreplaced = _UNREPLACED_RE.findall(judge_content) if "{" in judge_content else []
+        if unreplaced:
+            errors.append(
+                f"{jpath}: unreplaced variables: {', '.join(sorted(set(unreplaced)))}"
+            )
+    except Exception as exc:
+        errors.append(f"{yaml_path}: template rendering failed ({exc})")
+    return errors
+
+def validate_family(
+    split_root: Path, family: str, family_subdir: str | None = None, parallel: bool = True
+) -> Tuple[List[str], List[str]]:
+    """Validate a single family. Returns (error messages, validated subdirectory names).
+
+    With parallel=False, questions are validated in-process even for large subdirectories
+    (used when families themselves are already spread across worker processes).
+    """
     family_root = split_root / family
     if not family_root.exists():
-        return [f"Family not found: {family_root}"]
+        return [f"Family not found: {family_root}"], []
 
     if family_subdir:
         subdirs = [family_subdir]
     else:
-        subdirs = [
-            d.name
-            for d in sorted(family_root.iterdir())
-            if d.is_dir() and (d / "judge_prompts").exists()
-        ]
+        subdirs = [d.name for d in _subdirs_with(family_root, "judge_prompts")]
     errors: List[str] = []
 
     for sub in subdirs:
@@ -106,142 +290,25 @@ def validate_family(split_root: Path, family: str, family_subdir: str | None = N
         judge_dir = base / "judge_prompts"
         if not judge_dir.exists():
             errors.append(f"{base}: missing judge_prompts directory")
-        items = [d for d in sorted(base.iterdir()) if d.is_dir() and (d / "questions.yaml").exists()]
+        items = _subdirs_with(base, "questions.yaml")
         if not items:
             errors.append(f"{base}: no item directories with questions.yaml")
-        # Validate each question entry
+        # Validate each question entry (in parallel for large subdirectories; order is preserved)
+        tasks = []
         for item_dir in items:
             q_path = item_dir / "questions.yaml"
-            for entry in _load_questions(q_path):
-                if not isinstance(entry, dict):
-                    continue
-                judge_prompt = entry.get("judge_prompt")
-                if not judge_prompt:
-                    prompt_template = entry.get("prompt_template")
-                    if prompt_template:
-                        judge_prompt = str(Path("../judge_prompts") / f"{Path(prompt_template).stem}.md")
-                if not judge_prompt:
-                    errors.append(f"{q_path}: question {entry.get('id')} missing judge_prompt")
-                    continue
-                jpath, stem = _resolve_judge_path(item_dir, str(judge_prompt))
-                if not jpath.exists():
-                    errors.append(f"{q_path}: judge prompt not found: {judge_prompt}")
-                    continue
-                
-                # Validate template includes before rendering
-                include_errors = validate_template_includes(jpath, jpath.parent)
-                errors.extend(include_errors)
-                
-                rubrics_dir = item_dir / "rubrics"
-                if not rubrics_dir.exists():
-                    errors.append(f"{item_dir}: missing rubrics directory")
-                    continue
-                yaml_path = rubrics_dir / f"{stem}.yaml"
-                if not yaml_path.exists():
-                    errors.append(f"{yaml_path}: missing YAML for judge prompt {stem}")
-                    continue
-                try:
-                    # First, validate YAML syntax by rendering any template variables in the YAML itself
-                    # Note: Runtime variables in YAML are expected at runtime, so we provide mock values for validation
-                    # Mock runtime variables that might be used in YAML files
-                    # These are for OTA device swap debugging (runtime-generated)
-                    mock_runtime_vars = {
-                        "swapped_id": "M1",
-                        "from_type": "PMOS",
-                        "to_type": "NMOS",
-                        "bug_type": "device_polarity_swap",
-                    }
-                    
-                    try:
-                        rendered_yaml = render_template(
-                            yaml_path.read_text(encoding="utf-8"),
-                            mock_runtime_vars,
-                            base_dir=yaml_path.parent,
-                        )
-                    except ValueError as ve:
-                        # Check if this is a runtime variable error
-                        # TODO: Consider using a custom exception class (e.g., MissingRuntimeVariableError) in template.py
-                        #       for a more robust contract between modules instead of string matching
-                        error_msg = str(ve)
-                        if "Runtime variable" in error_msg and "not found in vars" in error_msg:
-                            # Parse the error message to extract the missing runtime variable name
-                            # Format: "Runtime variable '{key}' not found in vars"
-                            match = re.search(r"Runtime variable '([a-zA-Z0-9_]+)' not found in vars", error_msg)
-                            if match:
-                                missing_runtime_key = match.group(1)
-                                errors.append(
-                                    f"{yaml_path}: missing runtime variable binding: {missing_runtime_key} "
-                                    f"(required at runtime, not in validation mock vars)"
-                                )
-                            else:
-                                # Fallback if message format changes
-                                errors.append(
-                                    f"{yaml_path}: missing runtime variable binding (error: {error_msg}) "
-                                    f"(required at runtime, not in validation mock vars)"
-                                )
-                            # Skip further validation for this entry since we couldn't render the YAML
-                            continue
-                        else:
-                            # Re-raise non-runtime ValueError exceptions unchanged
-                            raise
-                    
-                    yaml_data = yaml.safe_load(rendered_yaml)
-                    if yaml_data is None:
-                        yaml_data = {}
-                    
-                    # Convert YAML data to string values for template rendering
-                    yaml_vars = {k: str(v) for k, v in yaml_data.items()}
-                    
-                    # Add mock runtime vars to yaml_vars for judge prompt rendering
-                    yaml_vars.update(mock_runtime_vars)
-                    
-                    # Render the judge prompt template with the YAML data
-                    # Note: Runtime variables (e.g., {runtime:swapped_id}) are provided at runtime,
-                    # so we catch ValueError for missing runtime vars during validation
-                    try:
-                        judge_content = render_template(
-                            jpath.read_text(encoding="utf-8"),
-                            yaml_vars,
-                            base_dir=jpath.parent,
-                        )
-                    except ValueError as ve:
-                        # Check if this is a runtime variable error
-                        # TODO: Consider using a custom exception class (e.g., MissingRuntimeVariableError) in template.py
-                        #       for a more robust contract between modules instead of string matching
-                        error_msg = str(ve)
-                        if "Runtime variable" in error_msg and "not found in vars" in error_msg:
-                            # Parse the error message to extract the missing runtime variable name
-                            # Format: "Runtime variable '{key}' not found in vars"
-                            match = re.search(r"Runtime variable '([a-zA-Z0-9_]+)' not found in vars", error_msg)
-                            if match:
-                                missing_runtime_key = match.group(1)
-                                errors.append(
-                                    f"{jpath}: missing runtime variable binding: {missing_runtime_key} "
-                                    f"(expected at runtime, not in validation mock vars)"
-                                )
-                            else:
-                                # Fallback if message format changes
-                                errors.append(
-                                    f"{jpath}: missing runtime variable binding (error: {error_msg})"
-                                )
-                            # Skip unreplaced-variable check for this prompt since we couldn't render it
-                            continue
-                        else:
-                            # Re-raise non-runtime ValueError exceptions unchanged
-                            raise
-                    
-                    # Check for unreplaced template variables
-                    # Use the same pattern as harness/utils/template.py: only alphanumeric + underscore
-                    # Note: Runtime directives {runtime:key} are not matched by this regex (no colon in character class)
-                    unreplaced = re.findall(r"\{([a-zA-Z0-9_]+)\}", judge_content)
-                    if unreplaced:
-                        errors.append(
-                            f"{jpath}: unreplaced variables: {', '.join(sorted(set(unreplaced)))}"
-                        )
-                except Exception as exc:
-                    errors.append(f"{yaml_path}: template rendering failed ({exc})")
+            tasks.extend((item_dir, q_path, entry) for entry in _load_questions(q_path))
+        # A pool only pays off with more than one CPU; never start more workers than there are chunks
+        workers = min(os.cpu_count() or 1, math.ceil(len(tasks) / _POOL_CHUNKSIZE))
+        if not parallel or len(tasks) < _PARALLEL_MIN_QUESTIONS or workers <= 1:
+            results = [_validate_question(*task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                results = list(ex.map(_validate_question, *zip(*tasks), chunksize=_POOL_CHUNKSIZE))
+        for question_errors in results:
+            errors.extend(question_errors)
     
-    return errors
+    return errors, subdirs
 
 
 def main() -> None:
@@ -271,15 +338,13 @@ def main() -> None:
         # 1. It has a judge_prompts directory directly, OR
         # 2. It has subdirectories containing judge_prompts
         families = []
-        for d in sorted(split_root.iterdir()):
-            if not d.is_dir():
-                continue
+        for d in _list_subdirs(split_root):
             # Check if family has judge_prompts directly
-            if (d / "judge_prompts").exists():
+            if os.path.exists(os.path.join(d, "judge_prompts")):
                 families.append(d.name)
                 continue
             # Check if any subdirectory has judge_prompts
-            if any((d / subdir / "judge_prompts").exists() for subdir in d.iterdir() if subdir.is_dir()):
+            if _subdirs_with(d, "judge_prompts"):
                 families.append(d.name)
         
         if not families:
@@ -290,24 +355,19 @@ def main() -> None:
     all_errors: List[str] = []
     validated_subdirs: List[str] = []
 
-    # Validate each family
-    for family in families:
-        family_errors = validate_family(split_root, family, args.family_subdir)
+    # Validate each family; families are independent, so spread them across processes when possible
+    workers = min(len(families), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            futures = [ex.submit(validate_family, split_root, family, args.family_subdir, False) for family in families]
+            results = [f.result() for f in futures]
+    else:
+        results = [validate_family(split_root, family, args.family_subdir) for family in families]
+
+    for family, (family_errors, subdirs) in zip(families, results):
         all_errors.extend(family_errors)
-        
         # Track which subdirs were validated for reporting
-        family_root = split_root / family
-        if family_root.exists():
-            if args.family_subdir:
-                validated_subdirs.append(f"{family}/{args.family_subdir}")
-            else:
-                subdirs = [
-                    d.name
-                    for d in sorted(family_root.iterdir())
-                    if d.is_dir() and (d / "judge_prompts").exists()
-                ]
-                if subdirs:
-                    validated_subdirs.extend([f"{family}/{sub}" for sub in subdirs])
+        validated_subdirs.extend(f"{family}/{sub}" for sub in subdirs)
 
     if all_errors:
         print("Judge prompt validation errors:")